@@ -7,7 +7,7 @@ Provides common ADB operations with proper error handling.
 import subprocess
 import os
 import shutil
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 
 def get_adb_path() -> str:
@@ -40,13 +40,16 @@ def get_adb_path() -> str:
     )
 
 
-def run_adb(args: List[str], timeout: int = 30) -> Tuple[str, str, int]:
+def run_adb(args: List[str], timeout: int = 30,
+            device_id: Optional[str] = None) -> Tuple[str, str, int]:
     """
     Execute an ADB command.
 
     Args:
         args: List of command arguments (e.g., ["devices", "-l"])
         timeout: Command timeout in seconds (default: 30)
+        device_id: Target device serial (adds "-s <serial>"), or None
+            for the default device
 
     Returns:
         Tuple of (stdout, stderr, return_code)
@@ -56,8 +59,9 @@ def run_adb(args: List[str], timeout: int = 30) -> Tuple[str, str, int]:
     """
     try:
         adb_path = get_adb_path()
+        device_args = ["-s", device_id] if device_id else []
         result = subprocess.run(
-            [adb_path] + args,
+            [adb_path] + device_args + args,
             capture_output=True,
             text=True,
             timeout=timeout
@@ -72,10 +76,13 @@ def run_adb(args: List[str], timeout: int = 30) -> Tuple[str, str, int]:
         return "", f"ADB command failed: {str(e)}", 1
 
 
-def check_device_connected() -> bool:
+def check_device_connected(device_id: Optional[str] = None) -> bool:
     """
     Check if an Android device is connected and authorized.
 
+    Args:
+        device_id: Specific device serial to check, or None for any device
+
     Returns:
         bool: True if device is connected and ready, False otherwise
     """
@@ -88,7 +95,8 @@ def check_device_connected() -> bool:
     lines = stdout.split('\n')[1:]  # Skip "List of devices attached"
     for line in lines:
         if line.strip() and '\tdevice' in line:
-            return True
+            if device_id is None or line.split('\t')[0] == device_id:
+                return True
 
     return False
 
@@ -8,45 +8,384 @@ This is the "action" step of the agent loop.
 Usage:
     echo '{"action":"tap","coordinates":[540,1200]}' | python execute_action.py
     python execute_action.py --json '{"action":"home"}'
+    python execute_action.py --json-batch '[{"action":"home"},{"action":"back"}]'
+    python -m utils.execute_action --json '{"action":"home"}'
+    python execute_action.py --json-parallel '[{"action":"home","device":"emulator-5554"},{"action":"home","device":"emulator-5556"}]'
+    python execute_action.py --daemon       # One JSON action per stdin line
 """
 
 import sys
 import os
 import json
-import argparse
+import math
 import time
-from datetime import datetime
-from typing import Dict, Any
+import atexit
+import threading
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import Dict, Any, List, Optional, Tuple
 
-# Add parent directory to path for imports
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from utils import adb_helper
+# orjson (optional) parses and encodes much faster than the stdlib json
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+try:
+    from . import adb_helper
+except ImportError:
+    # Run as a script (python utils/execute_action.py): utils/ is on sys.path
+    import adb_helper
 
 
 LOG_FILE = "logs/execution.log"
 
+# Create the log directory once per process rather than per log write
+try:
+    os.makedirs(os.path.dirname(LOG_FILE), exist_ok=True)
+except OSError:
+    pass  # log_action() tolerates a missing directory
+
+# Marker echoed after each command sent to the persistent shell
+SHELL_SENTINEL = "__END__"
+
+# Marker echoed after each action of a batch: "__MARK__<index>:<exit code>"
+BATCH_MARKER = "__MARK__"
+
+# `input text` needs spaces as %s; shell metacharacters are backslash-escaped
+# so the device shell passes them through literally (one str.translate pass)
+_INPUT_ESCAPE = str.maketrans({
+    " ": "%s",
+    "\\": "\\\\",
+    "'": "\\'",
+    "\"": "\\\"",
+    "`": "\\`",
+    "$": "\\$",
+    "&": "\\&",
+    "|": "\\|",
+    ";": "\\;",
+    "<": "\\<",
+    ">": "\\>",
+    "(": "\\(",
+    ")": "\\)",
+    "*": "\\*",
+    "?": "\\?",
+    "[": "\\[",
+    "]": "\\]",
+    "{": "\\{",
+    "}": "\\}",
+    "~": "\\~",
+    "#": "\\#",
+})
+
+# Control characters can't be escaped for `input text`; a newline would end
+# the shell command line and run the rest as a separate command
+_CONTROL_CHARS = frozenset(map(chr, [*range(32), 127]))
+
+# Device shell commands and message templates, built once at import
+_TAP_CMD = "input tap {} {}".format
+_TAP_LOG = "{},{}".format
+_TAP_MESSAGE = "Tapped at ({}, {})".format
+_TEXT_CMD = "input text {}".format
+
+# Commands and (log_details, success_message) for parameterless actions
+_FIXED_COMMANDS = {
+    "home": "input keyevent KEYCODE_HOME",
+    "back": "input keyevent KEYCODE_BACK",
+    "wait": "sleep 2",
+    "done": ":",
+}
+_FIXED_SUMMARIES = {
+    "home": ("", "Pressed Home button"),
+    "back": ("", "Pressed Back button"),
+    "wait": ("2s", "Waited 2 seconds"),
+    "done": ("", "Goal achieved - task complete"),
+}
+
+# Seconds a device connection probe result is reused
+DEVICE_PROBE_TTL = 2.0
+
+_log_fh = None
+
+# Device probe results per device serial (None = default device)
+_conn_cache: Dict[Optional[str], Dict[str, Any]] = {}
+
+# Persistent shell sessions per device serial (None = default device):
+# {"proc": Popen or None, "lock": Lock}
+_shells: Dict[Optional[str], Dict[str, Any]] = {}
+_shells_lock = threading.Lock()
+
+
+def _get_session(device_id: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Get the persistent shell session for a device, creating it if needed.
+
+    Args:
+        device_id: Device serial, or None for the default device
+
+    Returns:
+        Session dict with the shell process and the lock guarding it
+    """
+    with _shells_lock:
+        session = _shells.get(device_id)
+        if session is None:
+            session = {"proc": None, "lock": threading.Lock()}
+            _shells[device_id] = session
+        return session
+
+
+def _get_shell(session: Dict[str, Any], device_id: Optional[str] = None) -> subprocess.Popen:
+    """
+    Get the persistent `adb shell` process of a session, starting it if needed.
+
+    Args:
+        session: Session dict from _get_session
+        device_id: Device serial, or None for the default device
+
+    Returns:
+        subprocess.Popen: Running `adb shell` child with piped stdin/stdout
+    """
+    proc = session["proc"]
+
+    if proc is None or proc.poll() is not None:
+        device_args = ["-s", device_id] if device_id else []
+        proc = subprocess.Popen(
+            [adb_helper.get_adb_path()] + device_args + ["shell"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,  # Merged so an unread stderr pipe can't fill up
+            bufsize=-1,
+            text=True
+        )
+        session["proc"] = proc
+    return proc
+
+
+def _close_shell(session: Dict[str, Any]):
+    """Terminate the persistent `adb shell` process of a session, if any."""
+    proc = session["proc"]
+
+    if proc is not None:
+        try:
+            proc.kill()
+            proc.wait(timeout=1)
+        except Exception:
+            pass
+        session["proc"] = None
+
+
+def _close_shells():
+    """Terminate all persistent `adb shell` processes."""
+    for session in list(_shells.values()):
+        _close_shell(session)
+
+
+atexit.register(_close_shells)
+
+
+def _device_ok(device_id: Optional[str] = None) -> bool:
+    """
+    Check device connection, reusing a recent probe result.
+
+    Args:
+        device_id: Device serial, or None for any connected device
+
+    Returns:
+        bool: True if the device was connected within the last DEVICE_PROBE_TTL seconds
+    """
+    now = time.monotonic()
+    cached = _conn_cache.get(device_id)
+    if cached is not None and now - cached["t"] < DEVICE_PROBE_TTL:
+        return cached["ok"]
+
+    ok = adb_helper.check_device_connected(device_id)
+    _conn_cache[device_id] = {"ok": ok, "t": now}
+    return ok
+
+
+def _invalidate_device_probe():
+    """Force the next _device_ok() calls to re-probe their devices."""
+    _conn_cache.clear()
+
+
+def run_shell(command: str, timeout: int = 30,
+              device_id: Optional[str] = None) -> Tuple[str, str, int]:
+    """
+    Run a shell command on the device through the persistent `adb shell`.
+
+    Avoids spawning a new adb process (and device handshake) per action.
+    Falls back to a one-shot `adb shell` via adb_helper only if the
+    persistent shell cannot be started or the command cannot be sent to
+    it. If the shell dies after receiving the command, the command may
+    already have run, so an error is returned instead of replaying it.
+
+    Args:
+        command: Device shell command (e.g., "input tap 540 1200")
+        timeout: Command timeout in seconds (default: 30)
+        device_id: Device serial, or None for the default device
+
+    Returns:
+        Tuple of (stdout, stderr, return_code), as adb_helper.run_adb
+    """
+    session = _get_session(device_id)
+
+    with session["lock"]:
+        timed_out = threading.Event()
+        timer = None
+        output = []
+        sent = False
+
+        try:
+            shell = _get_shell(session, device_id)
+            timer = threading.Timer(timeout, lambda: (timed_out.set(), shell.kill()))
+            timer.start()
+
+            shell.stdin.write(f"{command} 2>&1; echo {SHELL_SENTINEL}$?\n")
+            shell.stdin.flush()
+            sent = True
+
+            while True:
+                line = shell.stdout.readline()
+                if not line:
+                    raise EOFError("adb shell exited")
+
+                # Sentinel may share a line with output lacking a trailing newline
+                head, found, tail = line.partition(SHELL_SENTINEL)
+                if found:
+                    output.append(head)
+                    code = int(tail.strip())
+                    break
+                output.append(line)
+
+        except (OSError, ValueError, EOFError):
+            _close_shell(session)
+            if timed_out.is_set():
+                return "", f"ADB command timed out after {timeout}s", 1
+            if sent:
+                text = "".join(output).strip()
+                return "", text or "adb shell exited before the command completed", 1
+            return adb_helper.run_adb(["shell", command], timeout=timeout, device_id=device_id)
+
+        finally:
+            if timer is not None:
+                timer.cancel()
+
+    text = "".join(output).strip()
+    if code != 0:
+        return "", text, code
+    return text, "", code
+
+
+def _get_log_fh():
+    """
+    Get the shared execution log handle, opening it on first use.
+
+    Returns:
+        Buffered binary file handle appending to LOG_FILE
+    """
+    global _log_fh
+
+    if _log_fh is None:
+        _log_fh = open(LOG_FILE, "ab", buffering=8192)
+    return _log_fh
+
+
+def _close_log_fh():
+    """Flush and close the execution log handle, if open."""
+    if _log_fh is not None:
+        try:
+            _log_fh.close()
+        except OSError:
+            pass
+
+
+atexit.register(_close_log_fh)
+
 
 def log_action(action_type: str, details: str, status: str):
     """
     Log action execution to file.
 
+    Entries are buffered and flushed when the process exits.
+
     Args:
         action_type: Type of action (tap, type, home, etc.)
         details: Action details (coordinates, text, etc.)
         status: SUCCESS or ERROR
     """
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
     log_entry = f"[{timestamp}] ACTION: {action_type}({details}) -> {status}\n"
 
     try:
-        os.makedirs("logs", exist_ok=True)
-        with open(LOG_FILE, "a", encoding="utf-8") as f:
-            f.write(log_entry)
+        _get_log_fh().write(log_entry.encode("utf-8"))
     except:
         pass  # Don't fail action execution due to logging errors
 
 
-def validate_action(action: Dict[str, Any]) -> tuple[bool, str]:
+VALID_ACTIONS = ("tap", "type", "home", "back", "wait", "done")
+_VALID_ACTION_SET = frozenset(VALID_ACTIONS)
+
+
+def _validate_tap(action: Dict[str, Any]) -> Tuple[bool, str, Any]:
+    """Validate tap-specific fields; normalizes to integer (x, y)."""
+    if "coordinates" not in action:
+        return False, "tap action requires 'coordinates' field", None
+    coords = action["coordinates"]
+    if not isinstance(coords, list) or len(coords) != 2:
+        return False, "coordinates must be [x, y] array", None
+    x, y = coords
+    if not (isinstance(x, (int, float)) and isinstance(y, (int, float))):
+        return False, "coordinates must be numeric", None
+    # Stdlib json accepts NaN/Infinity, which int() can't convert
+    if not (math.isfinite(x) and math.isfinite(y)):
+        return False, "coordinates must be numeric", None
+    return True, "", (int(x), int(y))
+
+
+def _validate_type(action: Dict[str, Any]) -> Tuple[bool, str, Any]:
+    """Validate type-specific fields; normalizes to the text."""
+    if "text" not in action:
+        return False, "type action requires 'text' field", None
+    text = action["text"]
+    if not isinstance(text, str):
+        return False, "text must be a string", None
+    if not _CONTROL_CHARS.isdisjoint(text):
+        return False, "text must not contain control characters (newlines, tabs)", None
+    return True, "", text
+
+
+def _validate_noop(action: Dict[str, Any]) -> Tuple[bool, str, Any]:
+    """Actions without extra fields are always valid."""
+    return True, "", None
+
+
+# Action-specific validators; actions not listed need no extra fields
+_VALIDATORS = {
+    "tap": _validate_tap,
+    "type": _validate_type,
+}
+
+
+def _device_error(action: Dict[str, Any]) -> str:
+    """Check the optional "device" field; returns an error message or ""."""
+    if "device" in action:
+        device_id = action["device"]
+        if not isinstance(device_id, str) or not device_id.strip():
+            return "device must be a device serial string"
+    return ""
+
+
+def validate_action(action: Dict[str, Any]) -> tuple[bool, str, Any]:
     """
     Validate action JSON format.
 
@@ -54,37 +393,115 @@ def validate_action(action: Dict[str, Any]) -> tuple[bool, str]:
         action: Action dictionary
 
     Returns:
-        Tuple of (is_valid, error_message)
+        Tuple of (is_valid, error_message, normalized), where normalized is
+        the parsed parameters: (x, y) ints for tap, the text for type,
+        None otherwise
     """
     if not isinstance(action, dict):
-        return False, "Action must be a JSON object"
+        return False, "Action must be a JSON object", None
 
     if "action" not in action:
-        return False, "Missing 'action' field"
+        return False, "Missing 'action' field", None
 
     action_type = action["action"]
-    valid_actions = ["tap", "type", "home", "back", "wait", "done"]
 
-    if action_type not in valid_actions:
-        return False, f"Invalid action type '{action_type}'. Must be one of: {valid_actions}"
+    if not isinstance(action_type, str) or action_type not in _VALID_ACTION_SET:
+        return False, f"Invalid action type '{action_type}'. Must be one of: {list(VALID_ACTIONS)}", None
+
+    device_error = _device_error(action)
+    if device_error:
+        return False, device_error, None
 
     # Validate action-specific fields
+    return _VALIDATORS.get(action_type, _validate_noop)(action)
+
+
+def _shell_command(action_type: str, normalized: Any) -> str:
+    """
+    Build the device shell command for a validated action.
+
+    Args:
+        action_type: Action type
+        normalized: Parameters returned by validate_action
+
+    Returns:
+        str: Shell command (e.g., "input tap 540 1200"); no-op ":" for done
+    """
     if action_type == "tap":
-        if "coordinates" not in action:
-            return False, "tap action requires 'coordinates' field"
-        coords = action["coordinates"]
-        if not isinstance(coords, list) or len(coords) != 2:
-            return False, "coordinates must be [x, y] array"
-        if not all(isinstance(c, (int, float)) for c in coords):
-            return False, "coordinates must be numeric"
+        return _TAP_CMD(*normalized)
+    elif action_type == "type":
+        return _TEXT_CMD(normalized.translate(_INPUT_ESCAPE))
+    return _FIXED_COMMANDS[action_type]
+
 
+def _summarize(action_type: str, normalized: Any) -> Tuple[str, str]:
+    """
+    Describe a validated action for the log and the result message.
+
+    Args:
+        action_type: Action type
+        normalized: Parameters returned by validate_action
+
+    Returns:
+        Tuple of (log_details, success_message)
+    """
+    if action_type == "tap":
+        return _TAP_LOG(*normalized), _TAP_MESSAGE(*normalized)
     elif action_type == "type":
-        if "text" not in action:
-            return False, "type action requires 'text' field"
-        if not isinstance(action["text"], str):
-            return False, "text must be a string"
+        return normalized, f"Typed: {normalized}"
+    return _FIXED_SUMMARIES[action_type]
+
 
-    return True, ""
+def _ok(action_type: str, details: str, message: str) -> Dict[str, Any]:
+    """Log a successful action and build its result."""
+    log_action(action_type, details, "SUCCESS")
+    return {"status": "success", "action": action_type, "message": message}
+
+
+def _fail(action_type: str, details: str, stderr: str) -> Dict[str, Any]:
+    """Log a failed device command and build its error result."""
+    _invalidate_device_probe()
+    log_action(action_type, details, f"ERROR: {stderr}")
+    return {"status": "error", "message": f"{action_type.capitalize()} failed: {stderr}"}
+
+
+def _not_connected_message(device_id: Optional[str]) -> str:
+    """Error message for a missing default or specific device."""
+    if device_id:
+        return f"Android device '{device_id}' not connected"
+    return "No Android device connected"
+
+
+def _do_device(action_type: str, normalized: Any, device_id: Optional[str]) -> Dict[str, Any]:
+    """Run a device action's shell command (tap, type, home, back)."""
+    details, message = _summarize(action_type, normalized)
+    stdout, stderr, code = run_shell(_shell_command(action_type, normalized), device_id=device_id)
+    if code != 0:
+        return _fail(action_type, details, stderr)
+    return _ok(action_type, details, message)
+
+
+def _do_wait(action_type: str, normalized: None, device_id: Optional[str]) -> Dict[str, Any]:
+    """Wait 2 seconds on the host for the UI to settle."""
+    time.sleep(2)
+    return _ok(action_type, *_summarize(action_type, normalized))
+
+
+def _do_done(action_type: str, normalized: None, device_id: Optional[str]) -> Dict[str, Any]:
+    """Mark the goal as achieved."""
+    return _ok(action_type, *_summarize(action_type, normalized))
+
+
+# Action handlers, called with (action_type, normalized, device_id) after
+# validation; commands and messages come from _shell_command/_summarize
+_HANDLERS = {
+    "tap": _do_device,
+    "type": _do_device,
+    "home": _do_device,
+    "back": _do_device,
+    "wait": _do_wait,
+    "done": _do_done,
+}
 
 
 def execute_action(action: Dict[str, Any]) -> Dict[str, Any]:
@@ -99,129 +516,40 @@ def execute_action(action: Dict[str, Any]) -> Dict[str, Any]:
             {"action": "back", "reason": "..."}
             {"action": "wait", "reason": "..."}
             {"action": "done", "reason": "..."}
+            Any action may add "device": "<serial>" to target a specific
+            device; the default device is used otherwise.
 
     Returns:
         Result dictionary:
             {"status": "success", "action": "tap", "message": "..."}
             {"status": "error", "message": "..."}
     """
+    # Fast path: done/wait need no extra fields and no device
+    action_type = action.get("action") if isinstance(action, dict) else None
+    if action_type == "done" or action_type == "wait":
+        device_error = _device_error(action)
+        if device_error:
+            return {"status": "error", "message": device_error}
+        return _HANDLERS[action_type](action_type, None, None)
+
     # Validate action format
-    is_valid, error_msg = validate_action(action)
+    is_valid, error_msg, normalized = validate_action(action)
     if not is_valid:
         return {"status": "error", "message": error_msg}
 
-    # Check device connection (except for done/wait)
-    action_type = action["action"]
-    if action_type not in ["done", "wait"]:
-        if not adb_helper.check_device_connected():
-            return {
-                "status": "error",
-                "message": "No Android device connected"
-            }
+    # Check device connection
+    device_id = action.get("device")
+    if not _device_ok(device_id):
+        return {
+            "status": "error",
+            "message": _not_connected_message(device_id)
+        }
 
     # Execute action
     try:
-        if action_type == "tap":
-            x, y = action["coordinates"]
-            x, y = int(x), int(y)
-
-            stdout, stderr, code = adb_helper.run_adb([
-                "shell", "input", "tap", str(x), str(y)
-            ])
-
-            if code != 0:
-                log_action("tap", f"{x},{y}", f"ERROR: {stderr}")
-                return {
-                    "status": "error",
-                    "message": f"Tap failed: {stderr}"
-                }
-
-            log_action("tap", f"{x},{y}", "SUCCESS")
-            return {
-                "status": "success",
-                "action": "tap",
-                "message": f"Tapped at ({x}, {y})"
-            }
-
-        elif action_type == "type":
-            text = action["text"]
-            # ADB requires spaces to be encoded as %s
-            encoded_text = text.replace(" ", "%s")
-
-            stdout, stderr, code = adb_helper.run_adb([
-                "shell", "input", "text", encoded_text
-            ])
-
-            if code != 0:
-                log_action("type", text, f"ERROR: {stderr}")
-                return {
-                    "status": "error",
-                    "message": f"Type failed: {stderr}"
-                }
-
-            log_action("type", text, "SUCCESS")
-            return {
-                "status": "success",
-                "action": "type",
-                "message": f"Typed: {text}"
-            }
-
-        elif action_type == "home":
-            stdout, stderr, code = adb_helper.run_adb([
-                "shell", "input", "keyevent", "KEYCODE_HOME"  # FIX: was KEYWORDS_HOME
-            ])
-
-            if code != 0:
-                log_action("home", "", f"ERROR: {stderr}")
-                return {
-                    "status": "error",
-                    "message": f"Home failed: {stderr}"
-                }
-
-            log_action("home", "", "SUCCESS")
-            return {
-                "status": "success",
-                "action": "home",
-                "message": "Pressed Home button"
-            }
-
-        elif action_type == "back":
-            stdout, stderr, code = adb_helper.run_adb([
-                "shell", "input", "keyevent", "KEYCODE_BACK"  # FIX: was KEYWORDS_BACK
-            ])
-
-            if code != 0:
-                log_action("back", "", f"ERROR: {stderr}")
-                return {
-                    "status": "error",
-                    "message": f"Back failed: {stderr}"
-                }
-
-            log_action("back", "", "SUCCESS")
-            return {
-                "status": "success",
-                "action": "back",
-                "message": "Pressed Back button"
-            }
-
-        elif action_type == "wait":
-            time.sleep(2)
-            log_action("wait", "2s", "SUCCESS")
-            return {
-                "status": "success",
-                "action": "wait",
-                "message": "Waited 2 seconds"
-            }
-
-        elif action_type == "done":
-            log_action("done", "", "SUCCESS")
-            return {
-                "status": "success",
-                "action": "done",
-                "message": "Goal achieved - task complete"
-            }
-
+        return _HANDLERS[action_type](action_type, normalized, device_id)
     except Exception as e:
+        _invalidate_device_probe()
         log_action(action_type, "", f"ERROR: {str(e)}")
         return {
             "status": "error",
@@ -229,7 +557,202 @@ def execute_action(action: Dict[str, Any]) -> Dict[str, Any]:
         }
 
 
-def main():
+def execute_actions(actions: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Execute a batch of actions with a single device shell round-trip.
+
+    All actions are validated first; nothing runs if any is invalid.
+    Commands are joined with ';' and run in order, so a failed action
+    does not stop the ones after it. Actions after "done" are ignored.
+    All actions must target the same device (see execute_actions_parallel
+    for multiple devices).
+
+    Args:
+        actions: List of action dictionaries (see execute_action)
+
+    Returns:
+        Result dictionary:
+            {"status": "success", "action": "batch", "results": [...]}
+            {"status": "error", "message": "...", "results": [...]}
+    """
+    if not isinstance(actions, list) or not actions:
+        return {"status": "error", "message": "Batch must be a non-empty JSON array"}
+
+    # (action_type, normalized) pairs, up to and including the first "done"
+    steps = []
+    for i, action in enumerate(actions):
+        is_valid, error_msg, normalized = validate_action(action)
+        if not is_valid:
+            return {"status": "error", "message": f"Action {i}: {error_msg}"}
+        steps.append((action["action"], normalized))
+
+    action_types = [action_type for action_type, _ in steps]
+    if "done" in action_types:
+        steps = steps[:action_types.index("done") + 1]
+
+    devices = {action.get("device") for action in actions[:len(steps)]}
+    if len(devices) > 1:
+        return {"status": "error", "message": "Batch actions must target the same device"}
+    device_id = devices.pop()
+
+    # Only done/wait: nothing to send to the device, handle them locally
+    if all(action_type in ["done", "wait"] for action_type, _ in steps):
+        results = [_HANDLERS[action_type](action_type, normalized, None) for action_type, normalized in steps]
+        return {"status": "success", "action": "batch", "results": results}
+
+    if not _device_ok(device_id):
+        return {
+            "status": "error",
+            "message": _not_connected_message(device_id)
+        }
+
+    # One compound command; each action echoes its index and exit code
+    compound = "; ".join(
+        f"{_shell_command(action_type, normalized)} 2>&1; echo {BATCH_MARKER}{i}:$?"
+        for i, (action_type, normalized) in enumerate(steps)
+    )
+    waits = sum(action_type == "wait" for action_type, _ in steps)
+    stdout, stderr, code = run_shell(compound, timeout=30 + 2 * waits, device_id=device_id)
+
+    # Split output into per-action exit codes and messages; on failure the
+    # partial output (markers of actions that did run) is in stderr
+    outcomes = {}
+    pending = []
+    for line in (stdout if code == 0 else stderr).split("\n"):
+        head, found, tail = line.partition(BATCH_MARKER)
+        if not found:
+            pending.append(line)
+            continue
+        index, _, exit_code = tail.partition(":")
+        pending.append(head)
+        outcomes[int(index)] = (int(exit_code), "\n".join(pending).strip())
+        pending = []
+    leftover = "\n".join(pending).strip()
+
+    results = []
+    for i, (action_type, normalized) in enumerate(steps):
+        details, message = _summarize(action_type, normalized)
+        exit_code, output = outcomes.get(i, (1, leftover or "Action did not complete"))
+
+        if exit_code != 0:
+            results.append(_fail(action_type, details, output))
+        else:
+            results.append(_ok(action_type, details, message))
+
+    errors = [result for result in results if result["status"] == "error"]
+    if errors:
+        return {
+            "status": "error",
+            "message": errors[0]["message"],
+            "results": results
+        }
+    return {"status": "success", "action": "batch", "results": results}
+
+
+def execute_actions_parallel(actions: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Execute actions on several devices concurrently.
+
+    Actions are grouped by their "device" field; each device's actions
+    run in order on a worker thread, while different devices run in
+    parallel (adb calls are I/O-bound). Actions without a "device" run
+    on the first connected device, in order with actions naming it.
+
+    Args:
+        actions: List of action dictionaries (see execute_action)
+
+    Returns:
+        Result dictionary, with results in input order:
+            {"status": "success", "action": "parallel", "results": [...]}
+            {"status": "error", "message": "...", "results": [...]}
+    """
+    if not isinstance(actions, list) or not actions:
+        return {"status": "error", "message": "Actions must be a non-empty JSON array"}
+
+    # Actions without a device go to the default device under its serial,
+    # so they share a group (and shell) with actions naming it explicitly
+    default_id = None
+    if any(isinstance(action, dict) and "device" not in action for action in actions):
+        try:
+            default_id = adb_helper.get_connected_device_id()
+        except RuntimeError:
+            pass  # Device actions report the missing device themselves
+
+    actions = list(actions)  # Resolved copies replace entries below
+    # Action indices per device; invalid device values are left to validation
+    groups: Dict[Optional[str], List[int]] = {}
+    for i, action in enumerate(actions):
+        if isinstance(action, dict) and "device" not in action and default_id:
+            actions[i] = action = dict(action, device=default_id)
+        device_id = action.get("device") if isinstance(action, dict) else None
+        if not isinstance(device_id, str):
+            device_id = None
+        groups.setdefault(device_id, []).append(i)
+
+    results: List[Optional[Dict[str, Any]]] = [None] * len(actions)
+
+    def run_group(indices: List[int]):
+        for i in indices:
+            results[i] = execute_action(actions[i])
+
+    with ThreadPoolExecutor(max_workers=len(groups)) as executor:
+        list(executor.map(run_group, groups.values()))
+
+    errors = [result for result in results if result["status"] == "error"]
+    if errors:
+        return {
+            "status": "error",
+            "message": errors[0]["message"],
+            "results": results
+        }
+    return {"status": "success", "action": "parallel", "results": results}
+
+
+def write_json(obj: Any):
+    """
+    Write obj to stdout as one line of compact JSON.
+
+    Writes UTF-8 bytes straight to the stdout buffer, bypassing the
+    text I/O layer.
+
+    Args:
+        obj: JSON-serializable result
+    """
+    sys.stdout.buffer.write(_dumps(obj))
+    sys.stdout.buffer.write(b"\n")
+    sys.stdout.buffer.flush()
+
+
+def parse_args(argv: List[str]) -> SimpleNamespace:
+    """
+    Parse command-line arguments.
+
+    The common invocations (no flags, --daemon, or a single --json /
+    --json-batch / --json-parallel value) are handled directly; argparse
+    is only imported for anything else, such as --help or malformed
+    arguments.
+
+    Args:
+        argv: Arguments without the program name (sys.argv[1:])
+
+    Returns:
+        Namespace with json, json_batch, json_parallel and daemon attributes
+    """
+    args = SimpleNamespace(json=None, json_batch=None, json_parallel=None, daemon=False)
+
+    if not argv:
+        return args
+
+    if argv == ["--daemon"]:
+        args.daemon = True
+        return args
+
+    if len(argv) == 2 and argv[0] in ("--json", "--json-batch", "--json-parallel"):
+        setattr(args, argv[0][2:].replace("-", "_"), argv[1])
+        return args
+
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Execute a single action on Android device"
     )
@@ -238,36 +761,106 @@ def main():
         type=str,
         help="Action JSON string (alternative to stdin)"
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--json-batch",
+        type=str,
+        help="JSON array of actions to execute in one device round-trip"
+    )
+    parser.add_argument(
+        "--json-parallel",
+        type=str,
+        help="JSON array of actions to run concurrently across their devices"
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Read newline-delimited JSON actions from stdin until EOF"
+    )
+    return parser.parse_args(argv)
+
 
-    # Get action JSON from --json flag or stdin
-    if args.json:
+def run_daemon():
+    """
+    Execute newline-delimited JSON actions from stdin until EOF.
+
+    Each line holds one action object (or an array, run as a batch) and
+    gets exactly one JSON result line on stdout. Keeps the interpreter
+    and the persistent adb shell alive across actions.
+    """
+    for line in sys.stdin.buffer:
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            action = _loads(line)
+        except ValueError as e:  # json/orjson JSONDecodeError
+            write_json({"status": "error", "message": f"Invalid JSON: {str(e)}"})
+            continue
+
+        # One bad action must not end the session
+        try:
+            if isinstance(action, list):
+                result = execute_actions(action)
+            else:
+                result = execute_action(action)
+        except Exception as e:
+            result = {"status": "error", "message": f"Execution error: {str(e)}"}
+
+        # Keep the log current for long-running sessions
+        if _log_fh is not None:
+            try:
+                _log_fh.flush()
+            except OSError:
+                pass
+
+        write_json(result)
+
+
+def main():
+    args = parse_args(sys.argv[1:])
+
+    if args.daemon:
+        run_daemon()
+        sys.exit(0)
+
+    # Get action JSON from --json/--json-batch/--json-parallel flag or stdin
+    if args.json_parallel:
+        action_json = args.json_parallel
+    elif args.json_batch:
+        action_json = args.json_batch
+    elif args.json:
         action_json = args.json
     else:
         action_json = sys.stdin.read().strip()
 
     if not action_json:
-        print(json.dumps({
+        write_json({
             "status": "error",
             "message": "No action provided. Use --json flag or pipe JSON via stdin"
-        }))
+        })
         sys.exit(1)
 
     # Parse JSON
     try:
-        action = json.loads(action_json)
-    except json.JSONDecodeError as e:
-        print(json.dumps({
+        action = _loads(action_json)
+    except ValueError as e:  # json/orjson JSONDecodeError
+        write_json({
             "status": "error",
             "message": f"Invalid JSON: {str(e)}"
-        }))
+        })
         sys.exit(1)
 
-    # Execute action
-    result = execute_action(action)
+    # Execute action(s)
+    if args.json_parallel:
+        result = execute_actions_parallel(action)
+    elif args.json_batch:
+        result = execute_actions(action)
+    else:
+        result = execute_action(action)
 
     # Output result
-    print(json.dumps(result, indent=2))
+    write_json(result)
 
     # Exit with appropriate code
     if result["status"] == "error":